@@ -10,66 +10,19 @@ likely causing it to deform inward at that point.
 
 """
 
-import numpy as np
-import pandas as pd
+from dropImpact import drop_grid
 
-# Constants
-young_modulus = 193e9  # Pa
-yield_strength = 172.369e6  # Pa
+# Parameters (material properties come from the table in dropImpact.py)
+material = '316 SS'
 outer_diameter = 35  # mm
 wall_thicknesses = [1, 2, 3]  # mm
 drop_heights = [0.5, 0.75, 0.8, 1.0, 1.5]  # meters
-density = 7800  # kg/m^3
-g = 9.81  # m/s^2
-
-# Function to calculate mass
-def calculate_mass(outer_diameter, wall_thickness):
-    inner_diameter = outer_diameter - 2 * wall_thickness
-    outer_radius = outer_diameter / 2000
-    inner_radius = inner_diameter / 2000
-    volume = np.pi * (outer_radius**2 - inner_radius**2) * 1.0
-    mass = density * volume
-    return mass
-
-# Data container
-data = []
-
-# Process each combination of parameters
-for wall_thickness in wall_thicknesses:
-    mass = calculate_mass(outer_diameter, wall_thickness)
-    inner_diameter = outer_diameter - 2 * wall_thickness
-    for height in drop_heights:
-        PE = mass * g * height
-        W = np.pi * ((outer_diameter / 2000)**3) * (wall_thickness / 1000) / 4
-        M = PE  # Assume moment is proportional to potential energy
-        sigma = M / W
-        
-        # Elastic deformation (curvature)
-        if sigma < yield_strength:
-            curvature = sigma / young_modulus
-            deformation = curvature * (outer_diameter / 2000)  # Small deformation approximation
-            plastic_deformation = "None"
-        else:
-            # Assuming linear plastic behavior for simplicity
-            # Plastic deformation is calculated with an arbitrary factor to show increased deformation
-            elastic_deformation = yield_strength / young_modulus * (outer_diameter / 2000)
-            additional_plastic_deformation = (sigma - yield_strength) / young_modulus * 1.5 * (outer_diameter / 2000)
-            deformation = elastic_deformation
-            plastic_deformation = additional_plastic_deformation
-
-        # Save results
-        data.append({
-            'Drop Height (m)': height,
-            'Inner Diameter (mm)': inner_diameter,
-            'Wall Thickness (mm)': wall_thickness,
-            'Potential Energy (J)': PE,
-            'Bending Stress (Pa)': sigma,
-            'Elastic Deformation (m)': deformation,
-            'Plastic Deformation (m)': plastic_deformation
-        })
-
-# Convert data to DataFrame for nice table display
-results_df = pd.DataFrame(data)
+
+# Evaluate every combination of parameters in one vectorised call
+results = drop_grid(wall_thicknesses, drop_heights, [outer_diameter], [material])
+
+# Convert results to DataFrame for nice table display
+results_df = results.to_dataframe()
 print(results_df.to_string(index=False))
 
 
@@ -175,6 +128,7 @@ def calculate_adjusted_SN_life(sigma_max, sigma_min, Kt, ultimate_strength, fati
     return N_f
 
 # Probabilistic approach to account for variability
+# (fatigueMonteCarlo.py samples the inputs instead of assuming sigma, run it for B10/B1 lives)
 def probabilistic_SN_life(N_f):
     # Assuming a log-normal distribution for life variability
     mu, sigma = np.log(N_f), 0.1  # sigma is assumed variability, replace with actual data
@@ -1,20 +1,20 @@
-import pandas as pd
+import glob
+
 import matplotlib.pyplot as plt
 
-# Data as per the table provided by the user
-data = {
-    "Wall Thickness (mm)": [2.5, 2.0, 1.5, 1.0, 0.5, 0.25, 0.2, 0.15, 0.1],
-    "Von Mises Stress Python (MPa)": [0.00, 0.00, 0.180503, 0.274796, 0.557674, 1.123431, 1.406310, 1.877774, 2.820701],
-    "Von Mises Stress SW (MPa)": [0.00, 0.08486, 0.1043, 0.1292, 0.1877, 0.2503, 0.2684, 0.2884, 0.3135]
-}
+from feaValidation import validate
 
-# Creating a DataFrame
-df = pd.DataFrame(data)
+# Every exported FEA result in this folder is compared with the analytical model
+fea_files = sorted(glob.glob('fea_results/*.csv'))
+df, metrics = validate(fea_files)
+print(metrics.to_string())
 
 # Plotting
 plt.figure(figsize=(10, 6))
-plt.plot(df["Wall Thickness (mm)"], df["Von Mises Stress Python (MPa)"], marker='o', label='Python Script')
-plt.plot(df["Wall Thickness (mm)"], df["Von Mises Stress SW (MPa)"], marker='s', label='SW')
+for case, case_df in df.groupby('Case', sort=False):
+    case_df = case_df.sort_values('Wall Thickness (mm)', ascending=False)
+    plt.plot(case_df["Wall Thickness (mm)"], case_df["Von Mises Stress Analytical (MPa)"], marker='o', label=f'Python Script ({case})')
+    plt.plot(case_df["Wall Thickness (mm)"], case_df["Von Mises Stress FEA (MPa)"], marker='s', label=f'FEA ({case})')
 
 # Titles and labels
 plt.title('Comparison of Von Mises Stress Over Wall Thickness')
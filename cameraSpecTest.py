@@ -2,46 +2,26 @@ import cv2
 import numpy as np
 import time
 
-def calculate_brightness(frame):
-    return np.mean(frame)
+from frameChangeDetector import FrameChangeDetector
+from imageMetrics import compute_metrics
+from metricRecorder import MetricRecorder
 
-def calculate_contrast(frame):
-    return np.std(frame)
-
-def calculate_saturation(frame):
-    hsv_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
-    saturation = hsv_frame[:, :, 1]
-    return np.mean(saturation)
-
-def calculate_sharpness(frame):
-    laplacian_var = cv2.Laplacian(frame, cv2.CV_64F).var()
-    return laplacian_var
-
-def calculate_color_balance(frame):
-    average_color_per_channel = np.mean(frame, axis=(0, 1))
-    return average_color_per_channel
-
-def calculate_noise_level(frame):
-    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-    noise_level = np.std(gray)
-    return noise_level
-
-def estimate_dynamic_range(frame):
-    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-    min_intensity = np.min(gray)
-    max_intensity = np.max(gray)
-    dynamic_range = max_intensity - min_intensity
-    return dynamic_range
-
-def calculate_motion_blur(frame):
-    variance = cv2.Laplacian(frame, cv2.CV_64F).var()
-    return variance
+# Metrics of the whole session are recorded to disk in the background,
+# a recording failure only stops the recording, never the live view
+try:
+    recorder = MetricRecorder(f"sessions/session_{time.strftime('%Y%m%d_%H%M%S')}.bin",
+                              fields=('brightness', 'contrast', 'sharpness', 'noise_level'))
+except OSError as error:
+    print(f"Error: Could not start session recording: {error}")
+    recorder = None
 
 camera_index = 3
 cap = cv2.VideoCapture(camera_index)
 
 if not cap.isOpened():
     print(f"Error: Could not open video capture device at index {camera_index}.")
+    if recorder is not None:
+        recorder.close()
     exit()
 
 # cap.set(cv2.CAP_PROP_FRAME_WIDTH, 500)
@@ -51,6 +31,10 @@ frame_count = 0
 start_time = time.time()
 zoom_level = 1.0  # Initial zoom level
 pan_x, pan_y = 0, 0  # Initial pan positions
+# Metrics are only recomputed when the scene changed, or at least every 5 seconds
+change_detector = FrameChangeDetector(threshold=2.0, max_age=5.0)
+live_metrics = ['brightness', 'contrast', 'saturation', 'sharpness', 'color_balance',
+                'noise_level', 'dynamic_range', 'motion_blur']
 
 try:
     while True:
@@ -91,14 +75,28 @@ try:
        
         # Update the calculations to use cropped_frame or resized_frame
         if frame_count % 30 == 0:  # Analyze metrics on the adjusted frame
-            brightness = calculate_brightness(cropped_frame)
-            contrast = calculate_contrast(cropped_frame)
-            saturation = calculate_saturation(cropped_frame)
-            sharpness = calculate_sharpness(cropped_frame)
-            color_balance = calculate_color_balance(cropped_frame)
-            noise_level = calculate_noise_level(cropped_frame)
-            dynamic_range = estimate_dynamic_range(cropped_frame)
-            motion_blur = calculate_motion_blur(cropped_frame)
+            # Reuse the cached metrics while the scope is held still
+            if change_detector.has_changed(cropped_frame):
+                metrics = compute_metrics(cropped_frame, live_metrics)
+                brightness = metrics['brightness']
+                contrast = metrics['contrast']
+                saturation = metrics['saturation']
+                sharpness = metrics['sharpness']
+                color_balance = metrics['color_balance']
+                noise_level = metrics['noise_level']
+                dynamic_range = metrics['dynamic_range']
+                motion_blur = metrics['motion_blur']
+
+            if recorder is not None:
+                try:
+                    recorder.record(brightness=brightness, contrast=contrast, sharpness=sharpness, noise_level=noise_level)
+                except OSError as error:
+                    print(f"Error: Session recording stopped: {error}")
+                    try:
+                        recorder.close()
+                    except OSError:
+                        pass  # Same error as reported above
+                    recorder = None
 
             overlay_texts = [
                 "Zoom & Pan Info:",
@@ -110,7 +108,7 @@ try:
                 f"Sharpness: {sharpness:.2f}",
                 f"Color Balance B:{color_balance[0]:.2f} G:{color_balance[1]:.2f} R:{color_balance[2]:.2f}",
                 f"Noise Level: {noise_level:.2f}",
-                f"Dynamic Range: {dynamic_range}",
+                f"Dynamic Range: {dynamic_range:.2f}",
                 f"Motion Blur: {motion_blur:.2f}"
             ]
 
@@ -132,18 +130,29 @@ try:
             break
         elif key == ord('w'):
             pan_y -= 10
+            change_detector.reset()
         elif key == ord('s'):
             pan_y += 10
+            change_detector.reset()
         elif key == ord('a'):
             pan_x -= 10
+            change_detector.reset()
         elif key == ord('d'):
             pan_x += 10
+            change_detector.reset()
         elif key == ord('r'):
             zoom_level = min(zoom_level + 0.1, 3.0)
+            change_detector.reset()
         elif key == ord('f'):
             zoom_level = max(zoom_level - 0.1, 1.0)
+            change_detector.reset()
 
         frame_count += 1
 finally:
     cap.release()
-    cv2.destroyAllWindows()
\ No newline at end of file
+    cv2.destroyAllWindows()
+    if recorder is not None:
+        try:
+            recorder.close()
+        except OSError as error:
+            print(f"Error: Session recording could not be saved completely: {error}")
\ No newline at end of file
@@ -0,0 +1,146 @@
+"""
+Vectorised drop-impact engine for the open cylinder of Modelling case 2
+
+Same model as the original drop-test loop:
+- The cylinder is dropped onto its side, the impact loads the wall in bending.
+- The bending moment is assumed proportional to the potential energy (M = m * g * h),
+  with the section modulus of a thin ring W = pi * r^3 * t / 4 (per metre of length).
+- Below yield the deformation is elastic, above yield the extra stress is turned into
+  plastic deformation with the same (arbitrary) factor of 1.5.
+
+Every input may be a scalar or an array, they are broadcast against each other so a
+whole sweep is evaluated in one call instead of a nested Python loop.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+g = 9.81  # m/s^2
+
+# Built-in material table (SI units)
+MATERIAL_NAMES = ('316 SS', '304 SS', 'Titanium', 'PEEK')
+MATERIALS = np.array(
+    [
+        # young_modulus (Pa), yield_strength (Pa), ultimate_strength (Pa), density (kg/m^3)
+        (193e9, 172.369e6, 540e6, 8000),  # 316 Stainless Steel (annealed)
+        (193e9, 215e6, 505e6, 8000),      # 304 Stainless Steel (annealed)
+        (114e9, 880e6, 950e6, 4430),      # Titanium Ti-6Al-4V
+        (3.6e9, 100e6, 100e6, 1300),      # PEEK (unfilled)
+    ],
+    dtype=[('young_modulus', 'f8'), ('yield_strength', 'f8'),
+           ('ultimate_strength', 'f8'), ('density', 'f8')],
+)
+
+
+class DropResult(NamedTuple):
+    """Columnar result of a drop sweep, every field is a 1D array of the same length."""
+    drop_height: np.ndarray            # m
+    wall_thickness: np.ndarray         # mm
+    outer_diameter: np.ndarray         # mm
+    inner_diameter: np.ndarray         # mm
+    material: np.ndarray               # index into MATERIAL_NAMES
+    potential_energy: np.ndarray       # J
+    bending_stress: np.ndarray         # Pa
+    elastic_deformation: np.ndarray    # m
+    plastic_deformation: np.ndarray    # m, 0 where the wall stays elastic
+    yielded: np.ndarray                # bool
+
+    def to_dataframe(self):
+        """Returns the result as a DataFrame with the column names of the original table."""
+        return pd.DataFrame({
+            'Material': np.asarray(MATERIAL_NAMES, dtype=object)[self.material],
+            'Drop Height (m)': self.drop_height,
+            'Outer Diameter (mm)': self.outer_diameter,
+            'Inner Diameter (mm)': self.inner_diameter,
+            'Wall Thickness (mm)': self.wall_thickness,
+            'Potential Energy (J)': self.potential_energy,
+            'Bending Stress (Pa)': self.bending_stress,
+            'Elastic Deformation (m)': self.elastic_deformation,
+            'Plastic Deformation (m)': self.plastic_deformation,
+            'Yielded': self.yielded,
+        })
+
+
+def material_codes(material):
+    """Converts material names (or already integer codes) to indices into MATERIALS."""
+    material = np.asarray(material)
+    if np.issubdtype(material.dtype, np.integer):
+        codes = material.astype(np.intp)
+        if codes.size and (codes.min() < 0 or codes.max() >= len(MATERIAL_NAMES)):
+            raise ValueError(f"Material code out of range 0..{len(MATERIAL_NAMES) - 1}")
+        return codes
+    # Only the unique names are looked up, the rest is a fancy index
+    names, inverse = np.unique(material, return_inverse=True)
+    lookup = []
+    for name in names:
+        if name not in MATERIAL_NAMES:
+            raise ValueError(f"Unknown material '{name}', choose from {MATERIAL_NAMES}")
+        lookup.append(MATERIAL_NAMES.index(name))
+    return np.asarray(lookup, dtype=np.intp)[inverse].reshape(material.shape)
+
+
+def calculate_mass(outer_diameter, wall_thickness, density):
+    """Mass per metre of cylinder length, diameters and thickness in mm."""
+    outer_radius = np.asarray(outer_diameter, dtype=np.float64) / 2000
+    inner_radius = outer_radius - np.asarray(wall_thickness, dtype=np.float64) / 1000
+    return density * np.pi * (outer_radius**2 - inner_radius**2)
+
+
+def simulate_drop(wall_thickness, drop_height, outer_diameter=35, material='316 SS'):
+    """
+    Evaluates the drop model for every (broadcast) combination of the inputs.
+
+    wall_thickness and outer_diameter are in mm, drop_height in m, material is a
+    name from MATERIAL_NAMES or its integer code. Returns a DropResult.
+    """
+    t, h, d, m = np.broadcast_arrays(
+        np.asarray(wall_thickness, dtype=np.float64),
+        np.asarray(drop_height, dtype=np.float64),
+        np.asarray(outer_diameter, dtype=np.float64),
+        material_codes(material),
+    )
+    t, h, d, m = t.ravel(), h.ravel(), d.ravel(), m.ravel()
+    if np.any(t <= 0) or np.any(2 * t >= d):
+        raise ValueError("Wall thickness must be positive and smaller than the outer radius")
+
+    props = MATERIALS[m]
+    young_modulus = props['young_modulus']
+    yield_strength = props['yield_strength']
+
+    outer_radius = d / 2000  # m
+    PE = calculate_mass(d, t, props['density']) * g * h
+    W = np.pi * outer_radius**3 * (t / 1000) / 4
+    sigma = PE / W  # Moment assumed equal to the potential energy
+
+    yielded = sigma >= yield_strength
+    # Elastic part is capped at yield, the remainder becomes plastic deformation
+    elastic_deformation = np.minimum(sigma, yield_strength) / young_modulus * outer_radius
+    plastic_deformation = np.maximum(sigma - yield_strength, 0.0) / young_modulus * 1.5 * outer_radius
+
+    return DropResult(
+        drop_height=h,
+        wall_thickness=t,
+        outer_diameter=d,
+        inner_diameter=d - 2 * t,
+        material=m,
+        potential_energy=PE,
+        bending_stress=sigma,
+        elastic_deformation=elastic_deformation,
+        plastic_deformation=plastic_deformation,
+        yielded=yielded,
+    )
+
+
+def drop_grid(wall_thicknesses, drop_heights, outer_diameters=(35,), materials=('316 SS',)):
+    """Runs simulate_drop on the full cartesian grid of the given 1D parameter lists."""
+    t, h, d, m = np.meshgrid(
+        np.asarray(wall_thicknesses, dtype=np.float64),
+        np.asarray(drop_heights, dtype=np.float64),
+        np.asarray(outer_diameters, dtype=np.float64),
+        material_codes(materials),
+        indexing='ij',
+        sparse=True,
+    )
+    return simulate_drop(t, h, d, m)
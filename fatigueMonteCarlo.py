@@ -0,0 +1,304 @@
+"""
+Monte Carlo fatigue-life engine
+
+Instead of evaluating the Basquin / Goodman life at one point and wrapping it in a
+lognormal with an assumed sigma, the load amplitude, mean stress, SCF and S-N
+coefficients are sampled from distributions and the life is computed for every sample:
+
+    sigma_a_eq = correction(Kt * sigma_a, Kt * sigma_m)
+    N_f = (sigma_a_eq / fatigue_strength_coefficient) ** (1 / fatigue_strength_exponent)
+
+(Basquin: sigma_a = sigma_f' * N_f ** b with b < 0, so the ratio is amplitude over coefficient.)
+
+Samples are generated in fixed-size batches and binned into a histogram of log10(N_f),
+so memory stays bounded no matter how many samples are drawn. Histograms from several
+worker processes are simply added together. B10 / B1 lives (10% / 1% failure
+probability) are read from the histogram, with order-statistic confidence intervals.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
+from typing import NamedTuple, Union
+
+import numpy as np
+
+
+class Distribution(NamedTuple):
+    """
+    Input distribution, kind is one of:
+    - 'fixed':     a = value
+    - 'normal':    a = mean, b = standard deviation
+    - 'lognormal': a = median, b = standard deviation of ln(x)
+    - 'uniform':   a = lower bound, b = upper bound
+    """
+    kind: str
+    a: float
+    b: float = 0.0
+
+    def sample(self, rng, n):
+        if self.kind == 'fixed':
+            return np.full(n, self.a, dtype=np.float64)
+        if self.kind == 'normal':
+            return rng.normal(self.a, self.b, n)
+        if self.kind == 'lognormal':
+            return rng.lognormal(np.log(self.a), self.b, n)
+        if self.kind == 'uniform':
+            return rng.uniform(self.a, self.b, n)
+        raise ValueError(f"Unknown distribution kind '{self.kind}'")
+
+
+Value = Union[Distribution, float]
+
+
+class FatigueInputs(NamedTuple):
+    """Stochastic inputs, every field is a Distribution or a plain number (Pa where applicable)."""
+    stress_amplitude: Value
+    mean_stress: Value
+    stress_concentration_factor: Value
+    fatigue_strength_coefficient: Value
+    fatigue_strength_exponent: Value
+    ultimate_strength: Value = 540e6  # 316 Stainless Steel
+    yield_strength: Value = 172.369e6
+
+
+# Mean stress corrections, each returns the knock-down factor on the amplitude:
+# sigma_a_eq = sigma_a / factor, a factor <= 0 means the mean stress alone exceeds the limit.
+# Compressive mean stress is clipped to 0 (the usual convention): it gets no correction,
+# neither a Gerber penalty nor an unlimited Goodman / Soderberg benefit.
+def goodman_correction(sigma_m, ultimate_strength, yield_strength):
+    return 1 - np.maximum(sigma_m, 0.0) / ultimate_strength
+
+def gerber_correction(sigma_m, ultimate_strength, yield_strength):
+    return 1 - (np.maximum(sigma_m, 0.0) / ultimate_strength) ** 2
+
+def soderberg_correction(sigma_m, ultimate_strength, yield_strength):
+    return 1 - np.maximum(sigma_m, 0.0) / yield_strength
+
+MEAN_STRESS_CORRECTIONS = {
+    'goodman': goodman_correction,
+    'gerber': gerber_correction,
+    'soderberg': soderberg_correction,
+}
+
+
+def _sample(value, rng, n):
+    if isinstance(value, Distribution):
+        return value.sample(rng, n)
+    return np.full(n, value, dtype=np.float64)
+
+
+def sample_lives(inputs, n, rng, correction='goodman'):
+    """
+    Draws n samples of the inputs and returns the cycles to failure for each of them.
+
+    A zero amplitude gives an infinite life, a mean stress beyond the limit of the
+    correction gives a life of 0 (failure on the first cycle).
+    """
+    correct = MEAN_STRESS_CORRECTIONS[correction]
+    Kt = _sample(inputs.stress_concentration_factor, rng, n)
+    sigma_a = _sample(inputs.stress_amplitude, rng, n) * Kt
+    sigma_m = _sample(inputs.mean_stress, rng, n) * Kt
+    sigma_f = _sample(inputs.fatigue_strength_coefficient, rng, n)
+    b = _sample(inputs.fatigue_strength_exponent, rng, n)
+    ultimate_strength = _sample(inputs.ultimate_strength, rng, n)
+    yield_strength = _sample(inputs.yield_strength, rng, n)
+
+    factor = correct(sigma_m, ultimate_strength, yield_strength)
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        sigma_a_eq = np.abs(sigma_a) / factor
+        lives = (sigma_a_eq / sigma_f) ** (1 / b)
+    lives[factor <= 0] = 0.0
+    return lives
+
+
+class LifeHistogram:
+    """
+    Fixed-bin histogram of log10(cycles to failure), bounded memory and mergeable.
+
+    Lives outside the binned range are only counted: immediate failures (life 0),
+    lives below 10**log_min, lives above 10**log_max (incl. infinite) and invalid (NaN)
+    samples, which are left out of the quantiles altogether.
+    """
+
+    def __init__(self, log_min=0.0, log_max=30.0, bins=30000):
+        self.log_min = log_min
+        self.log_max = log_max
+        self.bins = bins
+        self.bin_width = (log_max - log_min) / bins
+        self.counts = np.zeros(bins, dtype=np.int64)
+        self.immediate = 0
+        self.below = 0
+        self.above = 0
+        self.invalid = 0
+
+    @property
+    def n(self):
+        """Number of valid samples."""
+        return int(self.counts.sum()) + self.immediate + self.below + self.above
+
+    def add(self, lives):
+        lives = np.asarray(lives, dtype=np.float64)
+        invalid = np.isnan(lives)
+        immediate = lives == 0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            index = np.floor((np.log10(lives) - self.log_min) / self.bin_width)
+        below = ~immediate & (index < 0)
+        above = index >= self.bins
+        in_range = ~(invalid | immediate | below | above)
+
+        self.invalid += int(invalid.sum())
+        self.immediate += int(immediate.sum())
+        self.below += int(below.sum())
+        self.above += int(above.sum())
+        self.counts += np.bincount(index[in_range].astype(np.intp), minlength=self.bins)
+
+    def merge(self, other):
+        if (other.log_min, other.log_max, other.bins) != (self.log_min, self.log_max, self.bins):
+            raise ValueError("Cannot merge histograms with different bins")
+        self.counts += other.counts
+        self.immediate += other.immediate
+        self.below += other.below
+        self.above += other.above
+        self.invalid += other.invalid
+
+    def _life_at_rank(self, rank):
+        # Regions in order of increasing life: immediate, below range, the bins, above range
+        regions = np.concatenate(([self.immediate, self.below], self.counts, [self.above]))
+        cumulative = np.cumsum(regions)
+        rank = min(max(rank, 0.0), float(cumulative[-1]))
+        i = int(np.searchsorted(cumulative, rank, side='left' if rank == cumulative[-1] else 'right'))
+        if i == 0:
+            return 0.0
+        if i == 1:
+            return float('nan')  # Below the histogram range, no resolvable value
+        if i == len(regions) - 1:
+            return float('inf')
+        fraction = (rank - cumulative[i - 1]) / regions[i]
+        return float(10 ** (self.log_min + (i - 2 + fraction) * self.bin_width))
+
+    def quantile(self, p):
+        """
+        Life at failure probability p (e.g. 0.1 for B10). Returns 0.0 if the quantile falls
+        in the immediate failures, nan if it is below and inf if it is above the binned range.
+        """
+        if self.n == 0:
+            raise ValueError("Histogram is empty")
+        return self._life_at_rank(p * self.n)
+
+    def quantile_ci(self, p, confidence=0.95):
+        """Distribution-free confidence interval of the p-quantile from the binomial order statistics."""
+        n = self.n
+        if n == 0:
+            raise ValueError("Histogram is empty")
+        z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        half_width = z * np.sqrt(n * p * (1 - p))
+        return self._life_at_rank(n * p - half_width), self._life_at_rank(n * p + half_width)
+
+
+class FatigueReliability(NamedTuple):
+    n_samples: int
+    correction: str
+    confidence: float
+    b10: float
+    b10_ci: tuple
+    b1: float
+    b1_ci: tuple
+    median: float
+    immediate_failure_fraction: float  # Mean stress beyond the correction limit
+    below_range_fraction: float        # Lives below the histogram range
+    above_range_fraction: float        # Lives above the histogram range (incl. infinite)
+    invalid_fraction: float            # NaN lives from unphysical samples, left out of the quantiles
+    histogram: LifeHistogram
+
+
+def _run_batches(inputs, n_samples, batch_size, correction, seed_sequence, histogram_kwargs):
+    """Worker: samples n_samples lives in batches and returns their histogram."""
+    rng = np.random.default_rng(seed_sequence)
+    histogram = LifeHistogram(**histogram_kwargs)
+    remaining = n_samples
+    while remaining > 0:
+        n = min(batch_size, remaining)
+        histogram.add(sample_lives(inputs, n, rng, correction))
+        remaining -= n
+    return histogram
+
+
+def run_monte_carlo(inputs, n_samples=10_000_000, correction='goodman', batch_size=500_000,
+                    workers=None, seed=None, confidence=0.95, histogram_kwargs=None):
+    """
+    Runs the Monte Carlo simulation and reports B10 / B1 lives with confidence intervals.
+
+    The samples are split over `workers` processes (default: all cores, 1 runs in-process),
+    each worker holds at most batch_size samples in memory at a time. Quantiles outside
+    the binned range are reported as in LifeHistogram.quantile.
+    """
+    if correction not in MEAN_STRESS_CORRECTIONS:
+        raise ValueError(f"Unknown correction '{correction}', choose from {list(MEAN_STRESS_CORRECTIONS)}")
+    histogram_kwargs = histogram_kwargs or {}
+    workers = workers or os.cpu_count() or 1
+    workers = max(1, min(workers, -(-n_samples // batch_size)))
+
+    # Independent random streams per worker, reproducible for a given seed
+    seeds = np.random.SeedSequence(seed).spawn(workers)
+    shares = [n_samples // workers + (i < n_samples % workers) for i in range(workers)]
+
+    if workers == 1:
+        histogram = _run_batches(inputs, n_samples, batch_size, correction, seeds[0], histogram_kwargs)
+    else:
+        histogram = LifeHistogram(**histogram_kwargs)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_run_batches, inputs, share, batch_size, correction, s, histogram_kwargs)
+                       for share, s in zip(shares, seeds)]
+            for future in futures:
+                histogram.merge(future.result())
+
+    return FatigueReliability(
+        n_samples=n_samples,
+        correction=correction,
+        confidence=confidence,
+        b10=histogram.quantile(0.10),
+        b10_ci=histogram.quantile_ci(0.10, confidence),
+        b1=histogram.quantile(0.01),
+        b1_ci=histogram.quantile_ci(0.01, confidence),
+        median=histogram.quantile(0.50),
+        immediate_failure_fraction=histogram.immediate / n_samples,
+        below_range_fraction=histogram.below / n_samples,
+        above_range_fraction=histogram.above / n_samples,
+        invalid_fraction=histogram.invalid / n_samples,
+        histogram=histogram,
+    )
+
+
+def describe_life(life):
+    """Formats a quantile from run_monte_carlo, spelling out the out-of-range cases."""
+    if life == 0:
+        return "immediate failure"
+    if np.isnan(life):
+        return "below histogram range"
+    if np.isinf(life):
+        return "above histogram range"
+    return f"{life:.3e} cycles"
+
+
+if __name__ == '__main__':
+    # Same nominal values as the advanced fatigue script in Modelling case 2, with scatter added
+    max_stress = 250e6  # Pa
+    min_stress = 50e6  # Pa
+    inputs = FatigueInputs(
+        stress_amplitude=Distribution('normal', (max_stress - min_stress) / 2, 10e6),
+        mean_stress=Distribution('normal', (max_stress + min_stress) / 2, 10e6),
+        stress_concentration_factor=Distribution('uniform', 1.8, 2.2),
+        fatigue_strength_coefficient=Distribution('lognormal', 1000e6, 0.05),
+        fatigue_strength_exponent=Distribution('normal', -0.12, 0.005),
+        ultimate_strength=540e6,
+        yield_strength=172.369e6,
+    )
+    # Soderberg is left out: Kt * mean stress (~300 MPa) is beyond yield, every sample fails at once
+    for correction in ('goodman', 'gerber'):
+        result = run_monte_carlo(inputs, n_samples=10_000_000, correction=correction, seed=0)
+        print(f"{correction}: B10 = {describe_life(result.b10)} "
+              f"({describe_life(result.b10_ci[0])} - {describe_life(result.b10_ci[1])}), "
+              f"B1 = {describe_life(result.b1)} "
+              f"({describe_life(result.b1_ci[0])} - {describe_life(result.b1_ci[1])}), "
+              f"immediate failures: {result.immediate_failure_fraction:.2%}")
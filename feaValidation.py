@@ -0,0 +1,153 @@
+"""
+Validation of the analytical cylinder model (Modelling case 1) against FEA exports
+
+Each FEA export is a CSV file with one row per geometry:
+    Wall Thickness (mm), Von Mises Stress (MPa)
+and optionally 'Outer Diameter (mm)' (default 35), 'Pressure (mmHg)' (default 70) and
+'Case' (default: the file name). The analytical model is evaluated for all rows of all
+files in one vectorised call, results are memoised per geometry so rerunning over many
+exports only computes geometries that have not been seen before.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+young_modulus = 193e9  # Pa
+MMHG_TO_PA = 133.322368
+DEFAULT_OUTER_DIAMETER = 35  # mm
+DEFAULT_PRESSURE_MMHG = 70
+
+
+def cylinder_von_mises(wall_thickness, outer_diameter=DEFAULT_OUTER_DIAMETER, pressure_mmHg=DEFAULT_PRESSURE_MMHG):
+    """
+    Vectorised version of the thin-walled calculation in Modelling case 1.
+
+    Returns (von Mises stress in MPa, deformation in mm, thin-walled mask). Like the
+    original script, geometries that are not thin-walled get a stress and deformation of 0.
+    """
+    wall_thickness = np.asarray(wall_thickness, dtype=np.float64)
+    outer_diameter = np.asarray(outer_diameter, dtype=np.float64)
+    pressure_Pa = np.asarray(pressure_mmHg, dtype=np.float64) * MMHG_TO_PA
+
+    inner_diameter = outer_diameter - 2 * wall_thickness
+    mean_radius = (outer_diameter + inner_diameter) / 2 * 1e-3  # Same definition as Modelling case 1
+    wall_thickness_m = wall_thickness * 1e-3
+    thin_walled = wall_thickness / (outer_diameter / 2) < 0.1
+
+    hoop_stress = pressure_Pa * mean_radius / wall_thickness_m / 1e6  # MPa
+    longitudinal_stress = hoop_stress / 2
+    von_mises_stress = np.sqrt(hoop_stress**2 - hoop_stress * longitudinal_stress + longitudinal_stress**2)
+    deformation = pressure_Pa * mean_radius / (wall_thickness_m * young_modulus) * 1e3  # mm
+
+    return (np.where(thin_walled, von_mises_stress, 0.0),
+            np.where(thin_walled, deformation, 0.0),
+            thin_walled)
+
+
+class AnalyticalCache:
+    """Memoises analytical results by geometry (outer diameter, wall thickness, pressure)."""
+
+    def __init__(self, decimals=6):
+        self.decimals = decimals
+        self._results = {}
+
+    def __len__(self):
+        return len(self._results)
+
+    def evaluate(self, wall_thickness, outer_diameter, pressure_mmHg):
+        """Returns (von Mises stress, deformation, thin-walled mask) arrays, computing only unseen geometries."""
+        geometry = np.round(np.column_stack(np.broadcast_arrays(
+            np.asarray(outer_diameter, dtype=np.float64),
+            np.asarray(wall_thickness, dtype=np.float64),
+            np.asarray(pressure_mmHg, dtype=np.float64),
+        )), self.decimals)
+        unique, inverse = np.unique(geometry, axis=0, return_inverse=True)
+        keys = [tuple(row) for row in unique.tolist()]
+
+        missing = [i for i, key in enumerate(keys) if key not in self._results]
+        if missing:
+            d, t, p = unique[missing].T
+            stress, deformation, thin_walled = cylinder_von_mises(t, d, p)
+            for i, s, u, thin in zip(missing, stress.tolist(), deformation.tolist(), thin_walled.tolist()):
+                self._results[keys[i]] = (s, u, thin)
+
+        values = np.array([self._results[key] for key in keys], dtype=np.float64).reshape(-1, 3)
+        inverse = inverse.ravel()
+        return values[inverse, 0], values[inverse, 1], values[inverse, 2].astype(bool)
+
+
+_default_cache = AnalyticalCache()
+
+
+def load_fea_csv(path):
+    """Reads one FEA export and fills in the optional columns."""
+    df = pd.read_csv(path)
+    missing = {'Wall Thickness (mm)', 'Von Mises Stress (MPa)'} - set(df.columns)
+    if missing:
+        raise ValueError(f"{path}: missing column(s) {sorted(missing)}")
+    if 'Case' not in df.columns:
+        df['Case'] = os.path.splitext(os.path.basename(path))[0]
+    if 'Outer Diameter (mm)' not in df.columns:
+        df['Outer Diameter (mm)'] = DEFAULT_OUTER_DIAMETER
+    if 'Pressure (mmHg)' not in df.columns:
+        df['Pressure (mmHg)'] = DEFAULT_PRESSURE_MMHG
+    return df
+
+
+def error_metrics(df):
+    """
+    Per case error metrics of the analytical stress against the FEA stress. Rows that are
+    not thin-walled have no analytical prediction, they are only counted as excluded.
+    """
+    error = df['Von Mises Stress Analytical (MPa)'] - df['Von Mises Stress FEA (MPa)']
+    fea = df['Von Mises Stress FEA (MPa)']
+    thin_walled = df['Thin-Wall']
+    frame = pd.DataFrame({
+        'Case': df['Case'],
+        'included': thin_walled,
+        'abs_error': error.abs().where(thin_walled),
+        'sq_error': (error**2).where(thin_walled),
+        'rel_error': (error.abs() / fea.abs()).where(thin_walled & (fea != 0)),
+    })
+    grouped = frame.groupby('Case', sort=False)
+    return pd.DataFrame({
+        'Points': grouped['included'].sum(),
+        'Excluded (not thin-walled)': grouped.size() - grouped['included'].sum(),
+        'MAE (MPa)': grouped['abs_error'].mean(),
+        'RMSE (MPa)': np.sqrt(grouped['sq_error'].mean()),
+        'Max Abs Error (MPa)': grouped['abs_error'].max(),
+        'Mean Rel Error': grouped['rel_error'].mean(),
+    })
+
+
+def validate(paths, cache=None):
+    """
+    Compares every FEA export in paths with the analytical model.
+
+    Returns (detail, metrics): one row per FEA point with both stresses and the error,
+    and one row of error metrics per case. Geometries that are not thin-walled keep the
+    placeholder 0 MPa in the detail but are left out of the metrics.
+    """
+    cache = _default_cache if cache is None else cache
+    paths = list(paths)
+    if not paths:
+        raise ValueError("No FEA result files given, check the path / glob pattern of the FEA exports")
+    fea = pd.concat([load_fea_csv(path) for path in paths], ignore_index=True)
+
+    stress, deformation, thin_walled = cache.evaluate(fea['Wall Thickness (mm)'].to_numpy(),
+                                         fea['Outer Diameter (mm)'].to_numpy(),
+                                         fea['Pressure (mmHg)'].to_numpy())
+    detail = pd.DataFrame({
+        'Case': fea['Case'],
+        'Outer Diameter (mm)': fea['Outer Diameter (mm)'],
+        'Wall Thickness (mm)': fea['Wall Thickness (mm)'],
+        'Pressure (mmHg)': fea['Pressure (mmHg)'],
+        'Von Mises Stress FEA (MPa)': fea['Von Mises Stress (MPa)'],
+        'Von Mises Stress Analytical (MPa)': stress,
+        'Deformation Analytical (mm)': deformation,
+        'Thin-Wall': thin_walled,
+    })
+    detail['Error (MPa)'] = detail['Von Mises Stress Analytical (MPa)'] - detail['Von Mises Stress FEA (MPa)']
+    return detail, error_metrics(detail)
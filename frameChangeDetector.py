@@ -0,0 +1,59 @@
+"""
+Cheap frame-change detection for the live camera loop
+
+When the scope is held still consecutive frames are nearly identical, so the metrics
+do not need to be recomputed. Each frame is reduced to a small grayscale thumbnail and
+compared with the thumbnail of the frame the cached metrics were computed on, using the
+mean absolute difference. A forced refresh interval makes sure the cache never gets too old.
+"""
+
+import time
+
+import cv2
+import numpy as np
+
+
+class FrameChangeDetector:
+    def __init__(self, thumbnail_size=(32, 24), threshold=2.0, max_age=5.0):
+        """
+        thumbnail_size: (width, height) of the thumbnail the frames are compared on
+        threshold: mean absolute difference (0-255 gray levels) above which the scene has changed
+        max_age: seconds after which the metrics are recomputed anyway
+        """
+        self.thumbnail_size = thumbnail_size
+        self.threshold = threshold
+        self.max_age = max_age
+        self._reference = None
+        self._reference_time = 0.0
+
+    def thumbnail(self, frame):
+        small = cv2.resize(frame, self.thumbnail_size, interpolation=cv2.INTER_AREA)
+        if small.ndim == 3:
+            small = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+        return small
+
+    def difference(self, thumbnail):
+        """Mean absolute difference between a thumbnail and the reference thumbnail."""
+        if self._reference is None:
+            return float('inf')
+        return float(np.mean(cv2.absdiff(thumbnail, self._reference)))
+
+    def has_changed(self, frame, now=None):
+        """
+        Returns True if the metrics for this frame should be recomputed. In that case the
+        frame becomes the new reference, otherwise the cached metrics can be reused.
+        """
+        now = time.monotonic() if now is None else now
+        thumbnail = self.thumbnail(frame)
+        changed = (
+            now - self._reference_time >= self.max_age
+            or self.difference(thumbnail) > self.threshold
+        )
+        if changed:
+            self._reference = thumbnail
+            self._reference_time = now
+        return changed
+
+    def reset(self):
+        """Forces a recomputation on the next frame (e.g. after zoom or pan changed)."""
+        self._reference = None
@@ -2,10 +2,12 @@ import os
 import cv2
 import numpy as np
 import pandas as pd
-from skimage import exposure, feature, io, color
+from skimage import exposure, feature, color
 from skimage.measure import label, regionprops
 from sklearn.cluster import KMeans
-from PIL import Image, ImageStat
+from PIL import Image
+
+from imageMetrics import compute_metrics
 
 
 # Specify the path to the base folder containing patient cases
@@ -13,30 +15,6 @@ base_folder_path = r'\IARCImageBankVIA'
 
 
 # Metrics calculation functions
-def calculate_brightness(image):
-    img = Image.open(image).convert('L')
-    stat = ImageStat.Stat(img)
-    return stat.mean[0]
-
-def calculate_contrast(image):
-    img = cv2.imread(image, 0)
-    return img.std()
-
-def calculate_sharpness(image):
-    img = cv2.imread(image, cv2.IMREAD_GRAYSCALE)
-    return cv2.Laplacian(img, cv2.CV_64F).var()
-
-def calculate_noise_level(image):
-    img = cv2.imread(image)
-    dst = cv2.fastNlMeansDenoisingColored(img, None, 10, 10, 7, 21)
-    noise = img - dst
-    return np.mean(noise)
-
-def calculate_dynamic_range(image):
-    img = io.imread(image)
-    v_min, v_max = np.percentile(img, (2, 98))
-    return v_max - v_min
-
 def calculate_color_accuracy(image):
     img = cv2.imread(image)
     img_rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
@@ -78,6 +56,9 @@ def analyze_and_append_results(base_folder_path, csv_file_path):
                'Texture Dissimilarity', 'Texture Homogeneity', 'Texture ASM', 'Texture Energy',
                'Mean Area', 'Mean Eccentricity']
 
+    # Shared metrics, same definitions as the live camera test
+    batch_metrics = ['brightness', 'contrast', 'sharpness', 'noise_level', 'dynamic_range']
+
     # Initialize the CSV file with the appropriate columns
     initialize_csv(csv_file_path, columns)
 
@@ -96,11 +77,12 @@ def analyze_and_append_results(base_folder_path, csv_file_path):
 
                 # Process image and calculate metrics
                 width, height = get_image_dimensions(image_path)
-                brightness = calculate_brightness(image_path)
-                contrast = calculate_contrast(image_path)
-                sharpness = calculate_sharpness(image_path)
-                noise_level = calculate_noise_level(image_path)
-                dynamic_range = calculate_dynamic_range(image_path)
+                metrics = compute_metrics(cv2.imread(image_path), batch_metrics)
+                brightness = metrics['brightness']
+                contrast = metrics['contrast']
+                sharpness = metrics['sharpness']
+                noise_level = metrics['noise_level']
+                dynamic_range = metrics['dynamic_range']
                 color_accuracy = calculate_color_accuracy(image_path)
                 texture_features = calculate_texture(image_path)
                 geometric_properties = calculate_geometric_properties(image_path)
@@ -0,0 +1,124 @@
+"""
+Shared image metric library for the batch (imageAnalyzer.py) and live (cameraSpecTest.py) pipelines
+
+All metrics take a BGR frame as a NumPy array, as returned by cv2.imread or cap.read.
+Each metric declares the intermediates it needs (gray, hsv, laplacian); compute_metrics
+plans which intermediates are required for the requested metrics, computes each of them
+once per frame and then runs only the requested metrics, so live and offline numbers
+come from the exact same code.
+"""
+
+from typing import Callable, NamedTuple, Tuple
+
+import cv2
+import numpy as np
+
+
+def _gray(frame, inputs):
+    return cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if frame.ndim == 3 else frame
+
+def _hsv(frame, inputs):
+    return cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
+
+def _laplacian(frame, inputs):
+    return cv2.Laplacian(inputs['gray'], cv2.CV_64F)
+
+# Intermediate name -> (intermediates it depends on, function computing it)
+INTERMEDIATES = {
+    'gray': ((), _gray),
+    'hsv': ((), _hsv),
+    'laplacian': (('gray',), _laplacian),
+}
+
+
+class Metric(NamedTuple):
+    name: str
+    requires: Tuple[str, ...]
+    func: Callable
+
+
+METRICS = {}
+
+
+def register_metric(name, requires=()):
+    """Decorator adding func(frame, inputs) to the registry under name."""
+    unknown = set(requires) - set(INTERMEDIATES)
+    if unknown:
+        raise ValueError(f"Metric '{name}' requires unknown intermediate(s) {sorted(unknown)}")
+
+    def decorator(func):
+        METRICS[name] = Metric(name, tuple(requires), func)
+        return func
+    return decorator
+
+
+@register_metric('brightness', requires=('gray',))
+def brightness(frame, inputs):
+    return float(np.mean(inputs['gray']))
+
+@register_metric('contrast', requires=('gray',))
+def contrast(frame, inputs):
+    return float(np.std(inputs['gray']))
+
+@register_metric('saturation', requires=('hsv',))
+def saturation(frame, inputs):
+    return float(np.mean(inputs['hsv'][:, :, 1]))
+
+@register_metric('sharpness', requires=('laplacian',))
+def sharpness(frame, inputs):
+    return float(inputs['laplacian'].var())
+
+@register_metric('motion_blur', requires=('laplacian',))
+def motion_blur(frame, inputs):
+    # Low Laplacian variance means blur, same measure as sharpness
+    return float(inputs['laplacian'].var())
+
+@register_metric('color_balance')
+def color_balance(frame, inputs):
+    return np.mean(frame, axis=(0, 1))
+
+@register_metric('noise_level', requires=('gray',))
+def noise_level(frame, inputs):
+    # Immerkaer's fast noise estimate: the kernel cancels image structure up to
+    # second order, what remains is (mostly) noise
+    gray = inputs['gray'].astype(np.float64)
+    height, width = gray.shape
+    if height < 3 or width < 3:
+        return 0.0
+    kernel = np.array([[1, -2, 1], [-2, 4, -2], [1, -2, 1]], dtype=np.float64)
+    response = cv2.filter2D(gray, cv2.CV_64F, kernel)[1:-1, 1:-1]
+    return float(np.sqrt(np.pi / 2) * np.sum(np.abs(response)) / (6 * (width - 2) * (height - 2)))
+
+@register_metric('dynamic_range', requires=('gray',))
+def dynamic_range(frame, inputs):
+    # 2nd to 98th percentile so single hot or dead pixels don't dominate
+    v_min, v_max = np.percentile(inputs['gray'], (2, 98))
+    return float(v_max - v_min)
+
+
+def plan(names):
+    """Returns the intermediates needed for the metrics in names, dependencies first."""
+    order = []
+
+    def visit(intermediate):
+        if intermediate in order:
+            return
+        for dependency in INTERMEDIATES[intermediate][0]:
+            visit(dependency)
+        order.append(intermediate)
+
+    for name in names:
+        if name not in METRICS:
+            raise ValueError(f"Unknown metric '{name}', choose from {list(METRICS)}")
+        for intermediate in METRICS[name].requires:
+            visit(intermediate)
+    return order
+
+
+def compute_metrics(frame, names=None):
+    """Computes the requested metrics (default: all) for one BGR frame, returns a dict."""
+    names = list(METRICS) if names is None else list(names)
+    inputs = {}
+    for intermediate in plan(names):
+        inputs[intermediate] = INTERMEDIATES[intermediate][1](frame, inputs)
+    return {name: METRICS[name].func(frame, inputs) for name in names}
@@ -0,0 +1,149 @@
+"""
+Ring-buffered time-series recording of live metrics
+
+The live loop writes fixed-size records into a preallocated NumPy ring buffer, which
+costs one row assignment per sample. A background thread periodically appends the new
+records to a binary session file, so nothing is lost when the session runs for hours.
+
+Session file layout: the magic bytes, a uint32 header length, a JSON header with the
+record dtype, and then the raw records back to back. load_session memory-maps the
+records so a session can be analysed (e.g. next to imageValueAnalysis.py) without copying.
+"""
+
+import json
+import os
+import struct
+import threading
+import time
+
+import numpy as np
+
+MAGIC = b'CSPECTS1'
+DEFAULT_FIELDS = ('brightness', 'sharpness', 'noise_level')
+
+
+def record_dtype(fields=DEFAULT_FIELDS):
+    return np.dtype([('timestamp', '<f8')] + [(field, '<f4') for field in fields])
+
+
+class MetricRecorder:
+    def __init__(self, path, fields=DEFAULT_FIELDS, capacity=4096, flush_interval=2.0):
+        """
+        path: session file, created (or truncated) with a new header
+        fields: metric names stored next to the timestamp, as float32
+        capacity: number of records in the ring buffer, must hold at least one flush interval
+        flush_interval: seconds between background flushes
+        """
+        self.path = path
+        self.fields = tuple(fields)
+        self.dtype = record_dtype(self.fields)
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+        self.dropped = 0  # Records overwritten before they could be flushed
+        self.error = None  # First exception raised by a background flush
+
+        self._buffer = np.zeros(capacity, dtype=self.dtype)
+        self._written = 0  # Total records written into the ring buffer
+        self._flushed = 0  # Total records appended to the file
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._stop = threading.Event()
+
+        header = json.dumps({'descr': self.dtype.descr, 'fields': list(self.fields)}).encode()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, 'wb')
+        self._file.write(MAGIC + struct.pack('<I', len(header)) + header)
+        self._file.flush()
+
+        self._thread = threading.Thread(target=self._flush_loop, daemon=True)
+        self._thread.start()
+
+    def record(self, timestamp=None, **values):
+        """
+        Stores one sample, missing fields are recorded as NaN. Raises the error of a
+        failed background flush, so a full or removed disk doesn't go unnoticed.
+        """
+        if self.error is not None:
+            raise self.error
+        unknown = set(values) - set(self.fields)
+        if unknown:
+            raise ValueError(f"Unknown field(s) {sorted(unknown)}, recorder fields are {self.fields}")
+        row = (time.time() if timestamp is None else timestamp,) + \
+              tuple(values.get(field, np.nan) for field in self.fields)
+        with self._lock:
+            self._buffer[self._written % self.capacity] = row
+            self._written += 1
+
+    def flush(self):
+        """Appends all records written since the last flush to the session file."""
+        with self._flush_lock:
+            with self._lock:
+                written = self._written
+                start = max(self._flushed, written - self.capacity)
+                self.dropped += start - self._flushed
+                first, last = start % self.capacity, written % self.capacity
+                if written == start:
+                    chunks = []
+                elif first < last:
+                    chunks = [self._buffer[first:last].copy()]
+                else:
+                    chunks = [self._buffer[first:].copy(), self._buffer[:last].copy()]
+                self._flushed = written
+            # File I/O happens outside the lock so record() never waits on the disk
+            for chunk in chunks:
+                self._file.write(chunk.tobytes())
+            self._file.flush()
+
+    def _flush_loop(self):
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except OSError as error:
+                # Stored and raised from record() / close(), the thread stops flushing
+                self.error = error
+                return
+
+    def close(self):
+        self._stop.set()
+        self._thread.join()
+        try:
+            if self.error is None:
+                self.flush()
+        finally:
+            self._file.close()
+        if self.error is not None:
+            raise self.error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def load_session(path):
+    """Memory-maps the records of a session file as a structured array (zero-copy, read-only)."""
+    with open(path, 'rb') as f:
+        magic = f.read(len(MAGIC))
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a metric session file")
+        (header_length,) = struct.unpack('<I', f.read(4))
+        header = json.loads(f.read(header_length))
+    dtype = np.dtype([tuple(field) for field in header['descr']])
+    offset = len(MAGIC) + 4 + header_length
+    # A partially written last record (e.g. after a crash) is ignored
+    count = (os.path.getsize(path) - offset) // dtype.itemsize
+    if count == 0:
+        return np.zeros(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode='r', offset=offset, shape=(count,))
+
+
+def load_session_dataframe(path):
+    """Loads a session as a DataFrame (copies the data), e.g. for imageValueAnalysis.py."""
+    import pandas as pd
+    records = load_session(path)
+    df = pd.DataFrame({name: np.asarray(records[name]) for name in records.dtype.names})
+    df['timestamp'] = pd.to_datetime(df['timestamp'], unit='s')
+    return df